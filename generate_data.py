@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import argparse
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO, Tuple
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
@@ -13,18 +19,30 @@ NUM_ORDERS = 200
 NUM_ORDER_ITEMS = 500
 NUM_REVIEWS = 150
 
+# High-volume mode settings. Chunks have a fixed size so the output for a given
+# seed does not depend on how many worker processes are used.
+CHUNK_SIZE = 100_000
+POOL_SIZE = 5_000
+MAX_ITEMS_PER_ORDER = 5
+CATEGORIES = ["Electronics", "Home", "Outdoors", "Beauty", "Fitness", "Toys", "Books"]
+
 
 def sanitize_address(address: str) -> str:
     return " ".join(address.splitlines())
 
 
-def main() -> None:
+def generate_standard(
+    data_dir: Path,
+    num_users: int = NUM_USERS,
+    num_products: int = NUM_PRODUCTS,
+    num_orders: int = NUM_ORDERS,
+    num_order_items: int = NUM_ORDER_ITEMS,
+    num_reviews: int = NUM_REVIEWS,
+    seed: int = 42,
+) -> None:
     faker = Faker()
-    Faker.seed(42)
-    random.seed(42)
-
-    data_dir = Path("data")
-    data_dir.mkdir(parents=True, exist_ok=True)
+    Faker.seed(seed)
+    random.seed(seed)
 
     users = [
         {
@@ -33,20 +51,19 @@ def main() -> None:
             "email": faker.unique.email(),
             "address": sanitize_address(faker.address()),
         }
-        for idx in range(1, NUM_USERS + 1)
+        for idx in range(1, num_users + 1)
     ]
     pd.DataFrame(users).to_csv(data_dir / "users.csv", index=False)
     print(f"Generated {len(users)} users.")
 
-    categories = ["Electronics", "Home", "Outdoors", "Beauty", "Fitness", "Toys", "Books"]
     products = [
         {
             "id": idx,
             "name": faker.unique.catch_phrase(),
-            "category": random.choice(categories),
+            "category": random.choice(CATEGORIES),
             "price": round(random.uniform(5.0, 500.0), 2),
         }
-        for idx in range(1, NUM_PRODUCTS + 1)
+        for idx in range(1, num_products + 1)
     ]
     pd.DataFrame(products).to_csv(data_dir / "products.csv", index=False)
     print(f"Generated {len(products)} products.")
@@ -54,11 +71,11 @@ def main() -> None:
     orders = [
         {
             "id": idx,
-            "user_id": random.randint(1, NUM_USERS),
+            "user_id": random.randint(1, num_users),
             "order_date": faker.date_between(start_date="-1y", end_date="today").isoformat(),
             "total": round(random.uniform(20.0, 1500.0), 2),
         }
-        for idx in range(1, NUM_ORDERS + 1)
+        for idx in range(1, num_orders + 1)
     ]
     pd.DataFrame(orders).to_csv(data_dir / "orders.csv", index=False)
     print(f"Generated {len(orders)} orders.")
@@ -66,11 +83,11 @@ def main() -> None:
     order_items = [
         {
             "id": idx,
-            "order_id": random.randint(1, NUM_ORDERS),
-            "product_id": random.randint(1, NUM_PRODUCTS),
+            "order_id": random.randint(1, num_orders),
+            "product_id": random.randint(1, num_products),
             "quantity": random.randint(1, 5),
         }
-        for idx in range(1, NUM_ORDER_ITEMS + 1)
+        for idx in range(1, num_order_items + 1)
     ]
     pd.DataFrame(order_items).to_csv(data_dir / "order_items.csv", index=False)
     print(f"Generated {len(order_items)} order items.")
@@ -78,18 +95,499 @@ def main() -> None:
     reviews = [
         {
             "id": idx,
-            "product_id": random.randint(1, NUM_PRODUCTS),
-            "user_id": random.randint(1, NUM_USERS),
+            "product_id": random.randint(1, num_products),
+            "user_id": random.randint(1, num_users),
             "rating": random.randint(1, 5),
             "comment": faker.sentence(nb_words=12),
         }
-        for idx in range(1, NUM_REVIEWS + 1)
+        for idx in range(1, num_reviews + 1)
     ]
     pd.DataFrame(reviews).to_csv(data_dir / "reviews.csv", index=False)
     print(f"Generated {len(reviews)} reviews.")
 
 
-if __name__ == "__main__":
-    main()
+# --- High-volume mode -------------------------------------------------------
+#
+# Faker is only used to fill fixed-size pools of values once per run; rows are
+# composed by sampling pool indices with numpy, so Faker cost no longer grows
+# with the row count. Uniqueness comes from the row id (e.g. in emails and
+# product names), never from `faker.unique` retries.
+#
+# Pools and other run-wide arrays reach each worker process once, through the
+# executor initializer. Workers render their chunk to CSV text themselves and
+# the parent only appends the chunks to the output files in order.
+
+Chunk = Tuple[int, int, np.random.SeedSequence]  # (first_id, count, seed)
+Pools = Dict[str, List[str]]
+
+POOL_KINDS = ("name", "user_name", "email_domain", "address", "catch_phrase", "sentence")
+COLUMNS = {
+    "users": ["id", "name", "email", "address"],
+    "products": ["id", "name", "category", "price"],
+    "orders": ["id", "user_id", "order_date", "total"],
+    "order_items": ["id", "order_id", "product_id", "quantity"],
+    "reviews": ["id", "product_id", "user_id", "rating", "comment"],
+}
+
+_STATE: Dict[str, object] = {}
+
+
+def _init_worker(state: Dict[str, object]) -> None:
+    _STATE.update(state)
+
+
+def _build_pool(kind: str, seed: np.random.SeedSequence, pool_size: int) -> List[str]:
+    faker = Faker()
+    faker.seed_instance(int(seed.generate_state(1)[0]))
+    factories: Dict[str, Callable[[], str]] = {
+        "name": faker.name,
+        "user_name": faker.user_name,
+        "email_domain": faker.free_email_domain,
+        "address": lambda: sanitize_address(faker.address()),
+        "catch_phrase": faker.catch_phrase,
+        "sentence": lambda: faker.sentence(nb_words=12),
+    }
+    size = 32 if kind == "email_domain" else pool_size
+    return [factories[kind]() for _ in range(size)]
+
+
+def build_pools(
+    seed: np.random.SeedSequence, pool_size: int = POOL_SIZE, executor: ProcessPoolExecutor | None = None
+) -> Pools:
+    seeds = seed.spawn(len(POOL_KINDS))
+    mapper = map if executor is None else executor.map
+    return dict(zip(POOL_KINDS, mapper(_build_pool, POOL_KINDS, seeds, [pool_size] * len(POOL_KINDS))))
+
+
+def _sample(rng: np.random.Generator, pool: List[str], count: int) -> np.ndarray:
+    return np.asarray(pool, dtype=object)[rng.integers(0, len(pool), size=count)]
+
+
+def _ids(first_id: int, count: int) -> np.ndarray:
+    return np.arange(first_id, first_id + count, dtype=np.int64)
+
+
+def _csv_text(df: pd.DataFrame) -> str:
+    return df.to_csv(index=False, header=False)
+
+
+def _users_chunk(chunk: Chunk) -> str:
+    first_id, count, seed = chunk
+    pools: Pools = _STATE["pools"]
+    rng = np.random.default_rng(seed)
+    ids = _ids(first_id, count)
+    user_names = pd.Series(_sample(rng, pools["user_name"], count))
+    domains = pd.Series(_sample(rng, pools["email_domain"], count))
+    return _csv_text(
+        pd.DataFrame(
+            {
+                "id": ids,
+                "name": _sample(rng, pools["name"], count),
+                "email": user_names + "." + pd.Series(ids).astype(str) + "@" + domains,
+                "address": _sample(rng, pools["address"], count),
+            }
+        )
+    )
+
+
+def _products_chunk(chunk: Chunk) -> str:
+    first_id, count, seed = chunk
+    pools: Pools = _STATE["pools"]
+    prices: np.ndarray = _STATE["product_prices"]
+    rng = np.random.default_rng(seed)
+    ids = _ids(first_id, count)
+    phrases = pd.Series(_sample(rng, pools["catch_phrase"], count))
+    return _csv_text(
+        pd.DataFrame(
+            {
+                "id": ids,
+                "name": phrases + " #" + pd.Series(ids).astype(str),
+                "category": _sample(rng, CATEGORIES, count),
+                "price": prices[first_id - 1 : first_id - 1 + count],
+            }
+        )
+    )
+
+
+def _random_dates(rng: np.random.Generator, count: int) -> np.ndarray:
+    today = np.datetime64("today", "D")
+    offsets = rng.integers(0, 366, size=count).astype("timedelta64[D]")
+    return (today - offsets).astype(str)
+
+
+def _orders_chunk(chunk: Chunk, num_users: int) -> str:
+    first_id, count, seed = chunk
+    rng = np.random.default_rng(seed)
+    return _csv_text(
+        pd.DataFrame(
+            {
+                "id": _ids(first_id, count),
+                "user_id": rng.integers(1, num_users + 1, size=count),
+                "order_date": _random_dates(rng, count),
+                "total": np.round(rng.uniform(20.0, 1500.0, size=count), 2),
+            }
+        )
+    )
+
+
+def _order_items_chunk(chunk: Chunk, num_orders: int, num_products: int) -> str:
+    first_id, count, seed = chunk
+    rng = np.random.default_rng(seed)
+    return _csv_text(
+        pd.DataFrame(
+            {
+                "id": _ids(first_id, count),
+                "order_id": rng.integers(1, num_orders + 1, size=count),
+                "product_id": rng.integers(1, num_products + 1, size=count),
+                "quantity": rng.integers(1, 6, size=count),
+            }
+        )
+    )
+
+
+# Referentially consistent orders: like `src.data_generation.generate_order_items`,
+# every order gets 1..max_items line items and its total is the sum of their
+# line totals. Customers and products can be drawn from power-law (Zipfian)
+# popularity distributions so joins and aggregations see realistic hot keys.
+
+
+@lru_cache(maxsize=8)
+def _popularity(num_keys: int, exponent: float, layout_seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (cdf over popularity ranks, key id for each rank)."""
+    weights = 1.0 / np.arange(1, num_keys + 1, dtype=np.float64) ** exponent
+    cdf = np.cumsum(weights)
+    cdf /= cdf[-1]
+    # Shuffle which ids are hot so popularity is not tied to id order.
+    rank_to_id = np.random.default_rng(layout_seed).permutation(num_keys) + 1
+    return cdf, rank_to_id
+
+
+def _skewed_ids(
+    rng: np.random.Generator, num_keys: int, exponent: float, layout_seed: int, count: int
+) -> np.ndarray:
+    if exponent <= 0:
+        return rng.integers(1, num_keys + 1, size=count)
+    cdf, rank_to_id = _popularity(num_keys, exponent, layout_seed)
+    ranks = np.minimum(np.searchsorted(cdf, rng.random(count), side="right"), num_keys - 1)
+    return rank_to_id[ranks]
 
 
+def _orders_with_items_chunk(
+    chunk: Chunk,
+    num_users: int,
+    customer_skew: float,
+    product_skew: float,
+    layout_seed: int,
+) -> Tuple[str, str]:
+    first_id, count, seed = chunk
+    product_prices: np.ndarray = _STATE["product_prices"]
+    all_items_per_order: np.ndarray = _STATE["items_per_order"]
+    rng = np.random.default_rng(seed)
+    order_ids = _ids(first_id, count)
+    user_ids = _skewed_ids(rng, num_users, customer_skew, layout_seed, count)
+    order_dates = _random_dates(rng, count)
+
+    # Per-order item counts are drawn up front by the parent, so every chunk
+    # knows where its item ids start.
+    items_per_order = all_items_per_order[first_id - 1 : first_id - 1 + count]
+    first_item_id = int(all_items_per_order[: first_id - 1].sum()) + 1
+    num_items = int(items_per_order.sum())
+    product_ids = _skewed_ids(rng, len(product_prices), product_skew, layout_seed + 1, num_items)
+    quantities = rng.integers(1, 6, size=num_items)
+    line_totals = np.round(product_prices[product_ids - 1] * quantities, 2)
+    first_item = np.concatenate(([0], np.cumsum(items_per_order)[:-1]))
+
+    orders = pd.DataFrame(
+        {
+            "id": order_ids,
+            "user_id": user_ids,
+            "order_date": order_dates,
+            "total": np.round(np.add.reduceat(line_totals, first_item), 2),
+        }
+    )
+    items = pd.DataFrame(
+        {
+            "id": _ids(first_item_id, num_items),
+            "order_id": np.repeat(order_ids, items_per_order),
+            "product_id": product_ids,
+            "quantity": quantities,
+        }
+    )
+    return _csv_text(orders), _csv_text(items)
+
+
+def _reviews_chunk(chunk: Chunk, num_users: int, num_products: int) -> str:
+    first_id, count, seed = chunk
+    pools: Pools = _STATE["pools"]
+    rng = np.random.default_rng(seed)
+    return _csv_text(
+        pd.DataFrame(
+            {
+                "id": _ids(first_id, count),
+                "product_id": rng.integers(1, num_products + 1, size=count),
+                "user_id": rng.integers(1, num_users + 1, size=count),
+                "rating": rng.integers(1, 6, size=count),
+                "comment": _sample(rng, pools["sentence"], count),
+            }
+        )
+    )
+
+
+def _map_chunks(
+    executor: ProcessPoolExecutor | None,
+    worker: Callable[..., object],
+    table_seed: np.random.SeedSequence,
+    total: int,
+    *args: object,
+) -> Iterator[object]:
+    starts = range(1, total + 1, CHUNK_SIZE)
+    seeds = table_seed.spawn(len(starts))
+    chunks = [
+        (start, min(CHUNK_SIZE, total - start + 1), chunk_seed)
+        for start, chunk_seed in zip(starts, seeds)
+    ]
+    repeated = [[arg] * len(chunks) for arg in args]
+    mapper = map if executor is None else executor.map
+    return mapper(worker, chunks, *repeated)
+
+
+def _open_table(data_dir: Path, table: str) -> TextIO:
+    fh = (data_dir / f"{table}.csv").open("w", newline="", encoding="utf-8")
+    fh.write(pd.DataFrame(columns=COLUMNS[table]).to_csv(index=False))
+    return fh
+
+
+def _write_table(data_dir: Path, table: str, label: str, total: int, texts: Iterable[str]) -> None:
+    with _open_table(data_dir, table) as fh:
+        fh.writelines(texts)
+    print(f"Generated {total} {label}.")
+
+
+def generate_high_volume(
+    data_dir: Path,
+    num_users: int,
+    num_products: int,
+    num_orders: int,
+    num_order_items: int,
+    num_reviews: int,
+    seed: int = 42,
+    workers: int = 1,
+    pool_size: int = POOL_SIZE,
+    consistent: bool = False,
+    max_items_per_order: int = MAX_ITEMS_PER_ORDER,
+    customer_skew: float = 0.0,
+    product_skew: float = 0.0,
+) -> None:
+    """
+    Write all five tables as CSV using pooled Faker values, chunked numpy sampling
+    and a process pool.
+
+    Args:
+        data_dir: Directory that receives one `<table>.csv` per table.
+        num_users, num_products, num_orders, num_order_items, num_reviews: Row
+            counts per table.
+        seed: Root seed; output for a seed is identical for any `workers`.
+        workers: Number of worker processes (1 runs everything in-process).
+        pool_size: Number of Faker values pre-generated per pool.
+        consistent: Build order items per order, so `num_order_items` is
+            ignored, and make `orders.total` the sum of the items' price * quantity.
+        max_items_per_order: Upper bound on items per order when `consistent`.
+        customer_skew: Power-law exponent for orders per customer when
+            `consistent`; 0 is uniform.
+        product_skew: Zipf exponent for product popularity in order items when
+            `consistent`; 0 is uniform.
+    """
+    (
+        pools_seed,
+        users_seed,
+        products_seed,
+        prices_seed,
+        orders_seed,
+        items_seed,
+        items_per_order_seed,
+        reviews_seed,
+    ) = np.random.SeedSequence(seed).spawn(8)
+
+    prices = np.random.default_rng(prices_seed).uniform(5.0, 500.0, size=num_products)
+    state: Dict[str, object] = {"product_prices": np.round(prices, 2)}
+    if consistent:
+        state["items_per_order"] = np.random.default_rng(items_per_order_seed).integers(
+            1, max_items_per_order + 1, size=num_orders
+        )
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool_executor:
+            state["pools"] = build_pools(pools_seed, pool_size, pool_executor)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,))
+    else:
+        state["pools"] = build_pools(pools_seed, pool_size)
+        _init_worker(state)
+        executor = None
+
+    def run(
+        worker: Callable[..., object], table_seed: np.random.SeedSequence, total: int, *args: object
+    ) -> Iterator[object]:
+        return _map_chunks(executor, worker, table_seed, total, *args)
+
+    try:
+        _write_table(data_dir, "users", "users", num_users, run(_users_chunk, users_seed, num_users))
+        products = run(_products_chunk, products_seed, num_products)
+        _write_table(data_dir, "products", "products", num_products, products)
+
+        if consistent:
+            layout_seed = int(orders_seed.generate_state(1)[0])
+            num_items = int(state["items_per_order"].sum())
+            results = run(
+                _orders_with_items_chunk,
+                orders_seed,
+                num_orders,
+                num_users,
+                customer_skew,
+                product_skew,
+                layout_seed,
+            )
+            orders_fh = _open_table(data_dir, "orders")
+            items_fh = _open_table(data_dir, "order_items")
+            with orders_fh, items_fh:
+                for orders_text, items_text in results:
+                    orders_fh.write(orders_text)
+                    items_fh.write(items_text)
+            print(f"Generated {num_orders} orders.")
+            print(f"Generated {num_items} order items.")
+        else:
+            orders = run(_orders_chunk, orders_seed, num_orders, num_users)
+            _write_table(data_dir, "orders", "orders", num_orders, orders)
+            _write_table(
+                data_dir,
+                "order_items",
+                "order items",
+                num_order_items,
+                run(_order_items_chunk, items_seed, num_order_items, num_orders, num_products),
+            )
+
+        _write_table(
+            data_dir,
+            "reviews",
+            "reviews",
+            num_reviews,
+            run(_reviews_chunk, reviews_seed, num_reviews, num_users, num_products),
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _STATE.clear()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate synthetic e-commerce CSVs under ./data.")
+    parser.add_argument(
+        "--high-volume",
+        action="store_true",
+        help="Use pooled Faker values, vectorized sampling and multiple processes.",
+    )
+    parser.add_argument("--users", type=int, default=NUM_USERS)
+    parser.add_argument("--products", type=int, default=NUM_PRODUCTS)
+    parser.add_argument("--orders", type=int, default=NUM_ORDERS)
+    parser.add_argument("--order-items", type=int, default=NUM_ORDER_ITEMS)
+    parser.add_argument("--reviews", type=int, default=NUM_REVIEWS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE)
+    parser.add_argument(
+        "--consistent",
+        action="store_true",
+        help="Build order items per order and derive order totals from them (high-volume mode only).",
+    )
+    # The options below are only read with --consistent and are rejected otherwise;
+    # None marks "not given" so that check can tell an explicit default apart.
+    parser.add_argument(
+        "--max-items-per-order",
+        type=int,
+        default=None,
+        help=f"Upper bound on items per order (--consistent only, default {MAX_ITEMS_PER_ORDER}).",
+    )
+    parser.add_argument(
+        "--customer-skew",
+        type=float,
+        default=None,
+        help="Power-law exponent for orders per customer; 0 (default) is uniform. --consistent only.",
+    )
+    parser.add_argument(
+        "--product-skew",
+        type=float,
+        default=None,
+        help="Zipf exponent for product popularity in order items; 0 (default) is uniform. "
+        "--consistent only.",
+    )
+    args = parser.parse_args()
+    for flag in ("users", "products", "orders", "order_items", "reviews"):
+        if getattr(args, flag) < 0:
+            parser.error(f"--{flag.replace('_', '-')} must not be negative")
+    # Rows that reference another table need at least one key to point at.
+    references = {
+        "orders": ("users",),
+        "order_items": ("orders", "products"),
+        "reviews": ("users", "products"),
+    }
+    if args.consistent:
+        # Items are built per order (--order-items is ignored), so orders draw products.
+        references["orders"] = ("users", "products")
+        del references["order_items"]
+    for table, targets in references.items():
+        for target in targets:
+            if getattr(args, table) > 0 and getattr(args, target) == 0:
+                parser.error(f"--{table.replace('_', '-')} requires --{target} to be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.pool_size < 1:
+        parser.error("--pool-size must be at least 1")
+    if args.consistent and not args.high_volume:
+        parser.error("--consistent requires --high-volume")
+    for flag in ("max_items_per_order", "customer_skew", "product_skew"):
+        if getattr(args, flag) is not None and not args.consistent:
+            parser.error(f"--{flag.replace('_', '-')} requires --consistent")
+    if args.max_items_per_order is None:
+        args.max_items_per_order = MAX_ITEMS_PER_ORDER
+    if args.customer_skew is None:
+        args.customer_skew = 0.0
+    if args.product_skew is None:
+        args.product_skew = 0.0
+    if args.max_items_per_order < 1:
+        parser.error("--max-items-per-order must be at least 1")
+    if args.customer_skew < 0 or args.product_skew < 0:
+        parser.error("--customer-skew and --product-skew must not be negative")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    data_dir = Path("data")
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    counts = {
+        "num_users": args.users,
+        "num_products": args.products,
+        "num_orders": args.orders,
+        "num_order_items": args.order_items,
+        "num_reviews": args.reviews,
+    }
+    if not args.high_volume:
+        generate_standard(data_dir, **counts, seed=args.seed)
+        return
+
+    generate_high_volume(
+        data_dir,
+        **counts,
+        seed=args.seed,
+        workers=args.workers,
+        pool_size=args.pool_size,
+        consistent=args.consistent,
+        max_items_per_order=args.max_items_per_order,
+        customer_skew=args.customer_skew,
+        product_skew=args.product_skew,
+    )
+
+
+if __name__ == "__main__":
+    main()
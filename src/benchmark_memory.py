@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+import sys
+import tracemalloc
+from dataclasses import replace
+
+from data_generation import (
+    DataConfig,
+    generate_all_data,
+    generate_order_items,
+    generate_orders,
+    generate_products,
+    generate_users,
+)
+
+
+def measure_dataset(cfg: DataConfig) -> int:
+    """Return bytes held by the full dataset from `generate_all_data`."""
+    random.seed(42)
+    tracemalloc.start()
+    dataset = generate_all_data(cfg)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del dataset
+    return held
+
+
+def measure_order_items(cfg: DataConfig) -> tuple[int, int]:
+    """Return (bytes held by the order_items rows alone, order item count)."""
+    random.seed(42)
+    users = generate_users(cfg)
+    products = generate_products(cfg)
+    orders = generate_orders(cfg, users)
+    tracemalloc.start()
+    order_items = generate_order_items(cfg, orders, products)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, len(order_items)
+
+
+def main() -> None:
+    num_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    cfg = DataConfig(num_users=20_000, num_products=2_000, num_orders=num_orders, num_reviews=num_orders // 2)
+
+    print(f"{'mode':<10} {'order_items':>12} {'dataset MiB':>12} {'items MiB':>10} {'bytes/item row':>15}")
+    results = {}
+    for label, compact in (("dict", False), ("columnar", True)):
+        mode_cfg = replace(cfg, compact_rows=compact)
+        dataset_held = measure_dataset(mode_cfg)
+        items_held, item_count = measure_order_items(mode_cfg)
+        results[label] = (dataset_held, items_held)
+        print(
+            f"{label:<10} {item_count:>12} {dataset_held / 2**20:>12.1f} "
+            f"{items_held / 2**20:>10.1f} {items_held / item_count:>15.1f}"
+        )
+    print(f"dataset reduction: {results['dict'][0] / results['columnar'][0]:.1f}x")
+    print(f"order_items reduction: {results['dict'][1] / results['columnar'][1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
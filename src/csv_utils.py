@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable
 
 
-def write_table_to_csv(table_name: str, table_data: Dict[str, List[Dict[str, object]]], output_dir: Path) -> Path:
+def write_table_to_csv(table_name: str, table_data: Dict[str, object], output_dir: Path) -> Path:
     """
     Persist a table (fieldnames + rows) to CSV.
 
     Args:
         table_name: Logical table name (used for the filename).
-        table_data: Dictionary containing `fieldnames` and `rows`.
+        table_data: Dictionary containing `fieldnames` and `rows`, where `rows`
+            is either a list of dicts or a columnar table (anything with its
+            own `fieldnames` that iterates as tuples, e.g. `ColumnarTable`).
         output_dir: Root directory that will contain the CSV file.
 
     Returns:
@@ -22,12 +24,18 @@ def write_table_to_csv(table_name: str, table_data: Dict[str, List[Dict[str, obj
     csv_path = output_dir / f"{table_name}.csv"
 
     fieldnames: Iterable[str] = table_data["fieldnames"]
-    rows: Iterable[Dict[str, object]] = table_data["rows"]
+    rows = table_data["rows"]
+    tuple_fieldnames = getattr(rows, "fieldnames", None)
 
     with csv_path.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+        if tuple_fieldnames is not None:
+            writer = csv.writer(fh)
+            writer.writerow(tuple_fieldnames)
+            writer.writerows(rows)
+        else:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
 
     return csv_path
 
@@ -1,9 +1,57 @@
 from __future__ import annotations
 
 import random
+import sys
+from array import array
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Sequence
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+# (field name, column kind) pairs. The kind is an `array.array` typecode for
+# numeric columns, TEXT for a plain list of strings, or CATEGORY for a list of
+# strings from a small value set, which are interned so repeats share one object.
+TEXT = "text"
+CATEGORY = "category"
+Schema = Sequence[Tuple[str, str]]
+
+USER_SCHEMA: Schema = (
+    ("user_id", "q"),
+    ("first_name", CATEGORY),
+    ("last_name", CATEGORY),
+    ("email", TEXT),
+    ("signup_date", CATEGORY),
+    ("country", CATEGORY),
+)
+PRODUCT_SCHEMA: Schema = (
+    ("product_id", "q"),
+    ("name", CATEGORY),
+    ("category", CATEGORY),
+    ("price", "d"),
+    ("inventory", "q"),
+)
+ORDER_SCHEMA: Schema = (
+    ("order_id", "q"),
+    ("user_id", "q"),
+    ("order_date", CATEGORY),
+    ("status", CATEGORY),
+    ("total_amount", "d"),
+)
+ORDER_ITEM_SCHEMA: Schema = (
+    ("order_item_id", "q"),
+    ("order_id", "q"),
+    ("product_id", "q"),
+    ("quantity", "q"),
+    ("unit_price", "d"),
+    ("line_total", "d"),
+)
+REVIEW_SCHEMA: Schema = (
+    ("review_id", "q"),
+    ("user_id", "q"),
+    ("product_id", "q"),
+    ("rating", "q"),
+    ("review_date", CATEGORY),
+    ("comment", CATEGORY),
+)
 
 
 @dataclass(frozen=True)
@@ -15,6 +63,73 @@ class DataConfig:
     num_orders: int = 80
     max_items_per_order: int = 5
     num_reviews: int = 60
+    compact_rows: bool = False  # store rows column-wise in ColumnarTable instead of dicts
+
+
+class ColumnarTable:
+    """
+    Column-oriented row storage: one `array.array` per numeric field and one
+    string list per text field, so no per-row dict or boxed number is kept.
+    CATEGORY columns are interned with `sys.intern`.
+
+    Iterating yields plain tuples in `fieldnames` order, which both
+    `csv_utils.write_table_to_csv` and `sqlite_utils.load_rows_into_table`
+    consume directly.
+    """
+
+    __slots__ = ("fieldnames", "columns", "_categories")
+
+    def __init__(self, schema: Schema) -> None:
+        self.fieldnames: List[str] = [name for name, _ in schema]
+        self.columns: Dict[str, Union[array, List[str]]] = {
+            name: [] if kind in (TEXT, CATEGORY) else array(kind) for name, kind in schema
+        }
+        self._categories = frozenset(name for name, kind in schema if kind == CATEGORY)
+
+    def append(self, values: Sequence[object]) -> None:
+        for name, value in zip(self.fieldnames, values):
+            if name in self._categories:
+                value = sys.intern(value)
+            self.columns[name].append(value)
+
+    def get(self, idx: int, field: str) -> object:
+        return self.columns[field][idx]
+
+    def set(self, idx: int, field: str, value: object) -> None:
+        self.columns[field][idx] = value
+
+    def __len__(self) -> int:
+        return len(self.columns[self.fieldnames[0]])
+
+    def __iter__(self) -> Iterator[Tuple[object, ...]]:
+        return zip(*(self.columns[name] for name in self.fieldnames))
+
+
+Rows = Union[List[Dict[str, object]], ColumnarTable]
+
+
+def _new_rows(cfg: DataConfig, schema: Schema) -> Rows:
+    return ColumnarTable(schema) if cfg.compact_rows else []
+
+
+def _append_row(rows: Rows, schema: Schema, values: Sequence[object]) -> None:
+    if isinstance(rows, ColumnarTable):
+        rows.append(values)
+    else:
+        rows.append({name: value for (name, _), value in zip(schema, values)})
+
+
+def _get(rows: Rows, idx: int, field: str) -> object:
+    if isinstance(rows, ColumnarTable):
+        return rows.get(idx, field)
+    return rows[idx][field]
+
+
+def _set(rows: Rows, idx: int, field: str, value: object) -> None:
+    if isinstance(rows, ColumnarTable):
+        rows.set(idx, field, value)
+    else:
+        rows[idx][field] = value
 
 
 def _random_date(within_days: int = 120) -> str:
@@ -29,99 +144,91 @@ def _weighted_choice(options: Sequence[str]) -> str:
     return random.choice(tuple(options))
 
 
-def generate_users(cfg: DataConfig) -> List[Dict[str, str]]:
+def generate_users(cfg: DataConfig) -> Rows:
     first_names = ["Avery", "Jordan", "Parker", "Emerson", "Riley", "Quinn", "Dakota", "Harper"]
     last_names = ["Lee", "Garcia", "Patel", "Nguyen", "Walker", "Bennett", "Chen", "Lopez"]
     countries = ["USA", "Canada", "Germany", "India", "Brazil", "Australia", "UK"]
 
-    users = []
+    users = _new_rows(cfg, USER_SCHEMA)
     for idx in range(1, cfg.num_users + 1):
         first = random.choice(first_names)
         last = random.choice(last_names)
         email = f"{first.lower()}.{last.lower()}{idx}@example.com"
-        users.append(
-            {
-                "user_id": idx,
-                "first_name": first,
-                "last_name": last,
-                "email": email,
-                "signup_date": _random_date(365),
-                "country": random.choice(countries),
-            }
+        _append_row(
+            users,
+            USER_SCHEMA,
+            (idx, first, last, email, _random_date(365), random.choice(countries)),
         )
     return users
 
 
-def generate_products(cfg: DataConfig) -> List[Dict[str, object]]:
+def generate_products(cfg: DataConfig) -> Rows:
     categories = ["Electronics", "Home", "Outdoors", "Beauty", "Fitness", "Toys"]
     adjectives = ["Eco", "Smart", "Compact", "Premium", "Lite", "Pro"]
     nouns = ["Speaker", "Blender", "Tent", "Watch", "Mat", "Drone", "Bottle", "Camera"]
 
-    products = []
+    products = _new_rows(cfg, PRODUCT_SCHEMA)
     for idx in range(1, cfg.num_products + 1):
         name = f"{random.choice(adjectives)} {random.choice(nouns)}"
         price = round(random.uniform(15.0, 500.0), 2)
-        products.append(
-            {
-                "product_id": idx,
-                "name": name,
-                "category": random.choice(categories),
-                "price": price,
-                "inventory": random.randint(10, 400),
-            }
+        _append_row(
+            products,
+            PRODUCT_SCHEMA,
+            (idx, name, random.choice(categories), price, random.randint(10, 400)),
         )
     return products
 
 
-def generate_orders(cfg: DataConfig, users: List[Dict[str, object]]) -> List[Dict[str, object]]:
+def generate_orders(cfg: DataConfig, users: Rows) -> Rows:
     statuses = ["PENDING", "SHIPPED", "DELIVERED", "CANCELLED"]
-    orders = []
+    orders = _new_rows(cfg, ORDER_SCHEMA)
     for idx in range(1, cfg.num_orders + 1):
-        user = random.choice(users)
-        orders.append(
-            {
-                "order_id": idx,
-                "user_id": user["user_id"],
-                "order_date": _random_date(120),
-                "status": random.choices(statuses, weights=[0.2, 0.4, 0.35, 0.05])[0],
-                "total_amount": 0.0,  # updated after order items are generated
-            }
+        user_idx = random.randrange(len(users))
+        _append_row(
+            orders,
+            ORDER_SCHEMA,
+            (
+                idx,
+                _get(users, user_idx, "user_id"),
+                _random_date(120),
+                random.choices(statuses, weights=[0.2, 0.4, 0.35, 0.05])[0],
+                0.0,  # total_amount, updated after order items are generated
+            ),
         )
     return orders
 
 
-def generate_order_items(
-    cfg: DataConfig,
-    orders: List[Dict[str, object]],
-    products: List[Dict[str, object]],
-) -> List[Dict[str, object]]:
-    items = []
+def generate_order_items(cfg: DataConfig, orders: Rows, products: Rows) -> Rows:
+    items = _new_rows(cfg, ORDER_ITEM_SCHEMA)
     item_id = 1
-    for order in orders:
+    for order_idx in range(len(orders)):
+        order_id = _get(orders, order_idx, "order_id")
         num_items = random.randint(1, cfg.max_items_per_order)
         order_total = 0.0
         for _ in range(num_items):
-            product = random.choice(products)
+            product_idx = random.randrange(len(products))
             quantity = random.randint(1, 4)
-            unit_price = product["price"]
+            unit_price = _get(products, product_idx, "price")
             line_total = round(unit_price * quantity, 2)
             order_total += line_total
-            items.append(
-                {
-                    "order_item_id": item_id,
-                    "order_id": order["order_id"],
-                    "product_id": product["product_id"],
-                    "quantity": quantity,
-                    "unit_price": unit_price,
-                    "line_total": line_total,
-                }
+            _append_row(
+                items,
+                ORDER_ITEM_SCHEMA,
+                (
+                    item_id,
+                    order_id,
+                    _get(products, product_idx, "product_id"),
+                    quantity,
+                    unit_price,
+                    line_total,
+                ),
             )
             item_id += 1
-        order["total_amount"] = round(order_total, 2)
+        _set(orders, order_idx, "total_amount", round(order_total, 2))
     return items
 
 
-def generate_reviews(cfg: DataConfig, users: List[Dict[str, object]], products: List[Dict[str, object]]) -> List[Dict[str, object]]:
+def generate_reviews(cfg: DataConfig, users: Rows, products: Rows) -> Rows:
     comments = [
         "Great quality!",
         "Met expectations.",
@@ -132,23 +239,29 @@ def generate_reviews(cfg: DataConfig, users: List[Dict[str, object]], products:
         "Exceeded expectations!",
     ]
 
-    reviews = []
+    reviews = _new_rows(cfg, REVIEW_SCHEMA)
     for idx in range(1, cfg.num_reviews + 1):
-        user = random.choice(users)
-        product = random.choice(products)
-        reviews.append(
-            {
-                "review_id": idx,
-                "user_id": user["user_id"],
-                "product_id": product["product_id"],
-                "rating": random.randint(1, 5),
-                "review_date": _random_date(120),
-                "comment": random.choice(comments),
-            }
+        user_idx = random.randrange(len(users))
+        product_idx = random.randrange(len(products))
+        _append_row(
+            reviews,
+            REVIEW_SCHEMA,
+            (
+                idx,
+                _get(users, user_idx, "user_id"),
+                _get(products, product_idx, "product_id"),
+                random.randint(1, 5),
+                _random_date(120),
+                random.choice(comments),
+            ),
         )
     return reviews
 
 
+def _table(schema: Schema, rows: Rows) -> Dict[str, object]:
+    return {"fieldnames": [name for name, _ in schema], "rows": rows}
+
+
 def generate_all_data(cfg: DataConfig | None = None) -> Dict[str, Dict[str, object]]:
     cfg = cfg or DataConfig()
     users = generate_users(cfg)
@@ -158,11 +271,9 @@ def generate_all_data(cfg: DataConfig | None = None) -> Dict[str, Dict[str, obje
     reviews = generate_reviews(cfg, users, products)
 
     return {
-        "users": {"fieldnames": list(users[0].keys()), "rows": users},
-        "products": {"fieldnames": list(products[0].keys()), "rows": products},
-        "orders": {"fieldnames": list(orders[0].keys()), "rows": orders},
-        "order_items": {"fieldnames": list(order_items[0].keys()), "rows": order_items},
-        "reviews": {"fieldnames": list(reviews[0].keys()), "rows": reviews},
+        "users": _table(USER_SCHEMA, users),
+        "products": _table(PRODUCT_SCHEMA, products),
+        "orders": _table(ORDER_SCHEMA, orders),
+        "order_items": _table(ORDER_ITEM_SCHEMA, order_items),
+        "reviews": _table(REVIEW_SCHEMA, reviews),
     }
-
-
@@ -141,3 +141,28 @@ def load_all_from_csv(conn: sqlite3.Connection, table_to_csv: Dict[str, Path]) -
     return counts
 
 
+def load_rows_into_table(conn: sqlite3.Connection, table_name: str, table_data: Dict[str, object]) -> int:
+    """Insert in-memory rows (list of dicts or `ColumnarTable`) without a CSV round trip."""
+    rows = table_data["rows"]
+    fieldnames = getattr(rows, "fieldnames", None)
+    if fieldnames is not None:
+        values: Iterable[tuple] = rows
+    else:
+        fieldnames = list(table_data["fieldnames"])
+        values = (tuple(row[field] for field in fieldnames) for row in rows)
+
+    placeholders = ", ".join("?" for _ in fieldnames)
+    columns_clause = ", ".join(fieldnames)
+    cursor = conn.executemany(
+        f"INSERT INTO {table_name} ({columns_clause}) VALUES ({placeholders})",
+        values,
+    )
+    conn.commit()
+    return max(cursor.rowcount, 0)
+
+
+def load_all_from_dataset(conn: sqlite3.Connection, dataset: Dict[str, Dict[str, object]]) -> Dict[str, int]:
+    counts = {}
+    for table, table_data in dataset.items():
+        counts[table] = load_rows_into_table(conn, table, table_data)
+    return counts